@@ -0,0 +1,46 @@
+"""Add indexes of the common search filters to the audit table
+
+Revision ID: 1a0710df148b
+Revises: 5e2b6c0d1f3a
+Create Date: 2016-11-16 09:42:17.518290
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '1a0710df148b'
+down_revision = '5e2b6c0d1f3a'
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError, ProgrammingError, InternalError
+
+# The audit table is only contained in the token database, if
+# PI_AUDIT_SQL_URI is not set. Otherwise the indexes can be created with
+# pi-manage create_audit_indexes.
+INDEXES = [("ix_pidea_audit_date_action_success",
+            ["date", "action", "success"]),
+           ("ix_pidea_audit_serial", ["serial"]),
+           ("ix_pidea_audit_user_realm_date", ["user", "realm", "date"])]
+
+
+def upgrade():
+    for name, columns in INDEXES:
+        try:
+            op.create_index(name, 'pidea_audit', columns, unique=False)
+        except (OperationalError, ProgrammingError, InternalError) as exx:
+            print("Index {0!s} already exists or there is no audit "
+                  "table".format(name))
+            print(exx)
+
+        except Exception as exx:
+            print("Could not add index {0!s}".format(name))
+            print (exx)
+
+
+def downgrade():
+    for name, _columns in INDEXES:
+        try:
+            op.drop_index(name, table_name='pidea_audit')
+        except (OperationalError, ProgrammingError, InternalError) as exx:
+            print("Could not drop index {0!s}".format(name))
+            print(exx)
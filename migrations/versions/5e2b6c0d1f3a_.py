@@ -0,0 +1,32 @@
+"""Add index on the expiration of the challenges
+
+Revision ID: 5e2b6c0d1f3a
+Revises: 37e6b49fc686
+Create Date: 2016-11-14 11:20:31.245117
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '5e2b6c0d1f3a'
+down_revision = '37e6b49fc686'
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError, ProgrammingError, InternalError
+
+
+def upgrade():
+    try:
+        op.create_index(op.f('ix_challenge_expiration'), 'challenge',
+                        ['expiration'], unique=False)
+    except (OperationalError, ProgrammingError, InternalError) as exx:
+        print("Index ix_challenge_expiration already exists")
+        print(exx)
+
+    except Exception as exx:
+        print("Could not add index ix_challenge_expiration")
+        print (exx)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_challenge_expiration'), table_name='challenge')